@@ -1,14 +1,20 @@
 """Module with methods useful when backing up activities.
 """
-import codecs
 import json
 import logging
 import os
+import threading
 from datetime import datetime
 
 log = logging.getLogger(__name__)
 
-supported_export_formats = ["json_summary", "json_details", "gpx", "tcx", "fit"]
+_not_found_lock = threading.Lock()
+"""Serializes appends to the :attr:`not_found_file`: `download` runs on
+several worker threads, and interleaved buffered writes to the shared file
+could garble its lines (append-mode writes are not atomic on all
+platforms)."""
+
+supported_export_formats = ("json_summary", "json_details", "gpx", "tcx", "fit")
 """The range of supported export formats for activities."""
 
 format_suffix = {
@@ -70,7 +76,13 @@ def need_backup(activities, backup_dir, export_formats=None):
     :rtype: set of tuples of `(int, datetime)`
     """
     need_backup = set()
-    backed_up = os.listdir(backup_dir) + _not_found_activities(backup_dir)
+    # a set: membership is tested once per activity and format below, which
+    # with a list would make the scan quadratic in the archive size
+    # (os.scandir builds the set directly from the directory stream rather
+    # than materializing an intermediate name list like os.listdir)
+    with os.scandir(backup_dir) as dir_entries:
+        backed_up = {entry.name for entry in dir_entries}
+    backed_up.update(_not_found_activities(backup_dir))
 
     # get all activities missing at least one export format
     for activity in activities:
@@ -92,6 +104,47 @@ def _not_found_activities(backup_dir):
     return failed_activities
 
 
+def _write_json(dest, content):
+    with open(dest, encoding="utf-8", mode="w") as f:
+        f.write(json.dumps(content, ensure_ascii=False, indent=4))
+
+
+def _write_text(dest, content):
+    with open(dest, encoding="utf-8", mode="w") as f:
+        f.write(content)
+
+
+def _write_binary(dest, content):
+    with open(dest, mode="wb") as f:
+        f.write(content)
+
+
+def _atomic(write):
+    """Wraps a writer function so that content is first written to a
+    ``<dest>.part`` file which, once fully written, is atomically renamed
+    into place. An interrupted backup can then never leave a truncated
+    activity file behind that later runs would mistake for a complete
+    backup."""
+    def write_atomically(dest, content):
+        part = dest + ".part"
+        write(part, content)
+        os.replace(part, dest)
+    return write_atomically
+
+
+_format_handlers = {
+    "json_summary": ("get_activity_summary", _atomic(_write_json), False),
+    "json_details": ("get_activity_details", _atomic(_write_json), False),
+    "gpx": ("get_activity_gpx", _atomic(_write_text), True),
+    "tcx": ("get_activity_tcx", _atomic(_write_text), True),
+    "fit": ("get_activity_fit", _atomic(_write_binary), True),
+}
+"""Maps each export format to the name of the :class:`GarminClient` method
+that fetches it, a writer function for the fetched content, and whether
+the format may legitimately be missing for an activity (in which case a
+missing export is recorded in the :attr:`not_found_file`)."""
+
+
 def download(client, activity, retryer, backup_dir, export_formats=None):
     """Exports a Garmin Connect activity to a given set of formats
     and saves the resulting file(s) to a given backup directory.
@@ -116,51 +169,22 @@ def download(client, activity, retryer, backup_dir, export_formats=None):
     """
     id = activity[0]
 
-    if 'json_summary' in export_formats:
-        log.debug("getting json summary for %s", id)
-
-        activity_summary = retryer.call(client.get_activity_summary, id)
-        dest = os.path.join(
-            backup_dir, export_filename(activity, 'json_summary'))
-        with codecs.open(dest, encoding="utf-8", mode="w") as f:
-            f.write(json.dumps(activity_summary, ensure_ascii=False, indent=4))
-
-    if 'json_details' in export_formats:
-        log.debug("getting json details for %s", id)
-        activity_details = retryer.call(client.get_activity_details, id)
-        dest = os.path.join(backup_dir, export_filename(activity, 'json_details'))
-        with codecs.open(dest, encoding="utf-8", mode="w") as f:
-            f.write(json.dumps(activity_details, ensure_ascii=False, indent=4))
-
-    not_found_path = os.path.join(backup_dir, not_found_file)
-    with open(not_found_path, mode="a") as not_found:
-        if 'gpx' in export_formats:
-            log.debug("getting gpx for %s", id)
-            activity_gpx = retryer.call(client.get_activity_gpx, id)
-            dest = os.path.join(backup_dir, export_filename(activity, 'gpx'))
-            if activity_gpx is None:
-                not_found.write(os.path.basename(dest) + "\n")
-            else:
-                with codecs.open(dest, encoding="utf-8", mode="w") as f:
-                    f.write(activity_gpx)
-
-        if 'tcx' in export_formats:
-            log.debug("getting tcx for %s", id)
-            activity_tcx = retryer.call(client.get_activity_tcx, id)
-            dest = os.path.join(backup_dir, export_filename(activity, 'tcx'))
-            if activity_tcx is None:
-                not_found.write(os.path.basename(dest) + "\n")
-            else:
-                with codecs.open(dest, encoding="utf-8", mode="w") as f:
-                    f.write(activity_tcx)
-
-        if 'fit' in export_formats:
-            log.debug("getting fit for %s", id)
-            activity_fit = retryer.call(client.get_activity_fit, id)
-            dest = os.path.join(
-                backup_dir, export_filename(activity, 'fit'))
-            if activity_fit is None:
-                not_found.write(os.path.basename(dest) + "\n")
-            else:
-                with open(dest, mode="wb") as f:
-                    f.write(activity_fit)
+    not_found_entries = []
+    for export_format in supported_export_formats:
+        if export_format not in export_formats:
+            continue
+        fetch_method, write, may_be_missing = _format_handlers[export_format]
+        log.debug("getting %s for %s", export_format, id)
+        content = retryer.call(getattr(client, fetch_method), id)
+        dest = os.path.join(backup_dir, export_filename(activity, export_format))
+        if content is None and may_be_missing:
+            not_found_entries.append(os.path.basename(dest) + "\n")
+        else:
+            write(dest, content)
+
+    # append all of this activity's missing exports in one serialized write:
+    # the .not_found file is shared between concurrent download workers
+    if not_found_entries:
+        not_found_path = os.path.join(backup_dir, not_found_file)
+        with _not_found_lock, open(not_found_path, mode="a") as not_found:
+            not_found.writelines(not_found_entries)
@@ -9,7 +9,7 @@ import logging
 import os
 
 from garminexport.backup import supported_export_formats
-from garminexport.incremental_backup import incremental_backup
+from garminexport.incremental_backup import DEFAULT_CONCURRENCY, incremental_backup
 from garminexport.logging_config import LOG_LEVELS
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)-15s [%(levelname)s] %(message)s")
@@ -58,6 +58,11 @@ def parse_args() -> argparse.Namespace:
         help=("The maximum number of retries to make on failed attempts to fetch an activity. "
               "Exponential backoff will be used, meaning that the delay between successive attempts "
               "will double with every retry, starting at one second. DEFAULT: {}").format(DEFAULT_MAX_RETRIES))
+    parser.add_argument(
+        "--max-workers", metavar="NUM", default=DEFAULT_CONCURRENCY,
+        type=int,
+        help=("The number of concurrent download workers. "
+              "DEFAULT: {}").format(DEFAULT_CONCURRENCY))
 
     return parser.parse_args()
 
@@ -72,7 +77,8 @@ def main():
                            backup_dir=args.backup_dir,
                            export_formats=args.format,
                            ignore_errors=args.ignore_errors,
-                           max_retries=args.max_retries)
+                           max_retries=args.max_retries,
+                           concurrency=args.max_workers)
 
     except Exception as e:
         log.error("failed with exception: {}".format(e))
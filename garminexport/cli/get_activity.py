@@ -30,6 +30,7 @@ def main():
         "activity", metavar="<activity>", type=int, help="Activity ID.")
     parser.add_argument(
         "format", metavar="<format>", type=str,
+        choices=garminexport.backup.supported_export_formats,
         help="Export format (one of: {}).".format(garminexport.backup.supported_export_formats))
 
     # optional args
@@ -40,20 +41,12 @@ def main():
         help="Destination directory for downloaded activity. Default: ./activities/",
         default=os.path.join(".", "activities"))
     parser.add_argument(
-        "--log-level", metavar="LEVEL", type=str,
+        "--log-level", metavar="LEVEL", type=str, choices=LOG_LEVELS,
         help="Desired log output level (DEBUG, INFO, WARNING, ERROR). Default: INFO.",
         default="INFO")
 
     args = parser.parse_args()
 
-    if args.log_level not in LOG_LEVELS:
-        raise ValueError("Illegal log-level argument: {}".format(args.log_level))
-
-    if args.format not in garminexport.backup.supported_export_formats:
-        raise ValueError(
-            "Unrecognized export format: '{}'. Must be one of {}".format(
-                args.format, garminexport.backup.supported_export_formats))
-
     logging.root.setLevel(LOG_LEVELS[args.log_level])
 
     try:
@@ -2,7 +2,7 @@
 """A program that uploads an activity file to a Garmin Connect account.
 """
 import argparse
-import getpass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
 from garminexport.garminclient import GarminClient
@@ -34,6 +34,9 @@ def main():
         '-P', '--private', action='store_true', help="Make activity private on Garmin Connect.")
     parser.add_argument(
         '-T', '--type', help="Override activity type (running, cycling, walking, hiking, strength_training, etc.)")
+    parser.add_argument(
+        '--parallel', metavar="NUM", type=int, default=1,
+        help="Number of concurrent uploads when several files are given. Default: 1.")
     parser.add_argument(
         "--log-level", metavar="LEVEL", type=str,
         help="Desired log output level (DEBUG, INFO, WARNING, ERROR). Default: INFO.",
@@ -51,18 +54,29 @@ def main():
 
     try:
         if not args.password:
+            # deferred import: getpass drags in termios and friends, which
+            # is startup cost wasted whenever --password is given
+            import getpass
             args.password = getpass.getpass("Enter password: ")
 
         with GarminClient(args.username, args.password) as client:
-            for activity in args.activity:
+            def upload(activity):
                 log.info("uploading activity file %s ...", activity.name)
-                try:
-                    id = client.upload_activity(activity, name=args.name, description=args.description,
-                                                private=args.private, activity_type=args.type)
-                except Exception as e:
-                    log.error("upload failed: {!r}".format(e))
-                else:
-                    log.info("upload successful: https://connect.garmin.com/modern/activity/%s", id)
+                return client.upload_activity(activity, name=args.name, description=args.description,
+                                              private=args.private, activity_type=args.type)
+
+            # the authenticated session is safe to share between threads, so
+            # bulk uploads can be fanned out over a bounded worker pool (the
+            # default of a single worker retains sequential behavior)
+            with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+                futures = [executor.submit(upload, activity) for activity in args.activity]
+                for future in as_completed(futures):
+                    try:
+                        id = future.result()
+                    except Exception as e:
+                        log.error("upload failed: %r", e)
+                    else:
+                        log.info("upload successful: https://connect.garmin.com/modern/activity/%s", id)
 
     except Exception as e:
         log.error("failed with exception: %s", e)
@@ -2,20 +2,24 @@
 """A module for authenticating against and communicating with selected
 parts of the Garmin Connect REST API.
 """
-from builtins import range
-from datetime import timedelta, datetime
-import dateutil
+import concurrent.futures
+from datetime import timedelta, datetime, timezone
 import dateutil.parser
 from functools import partial, wraps
 from io import BytesIO
+from itertools import count
 import json
 import logging
 import os
 import os.path
+import pickle
 import requests
-import sys
+import tempfile
+import time
 import zipfile
 
+from urllib3.util.retry import Retry
+
 from garminexport.retryer import Retryer, ExponentialBackoffDelayStrategy, MaxRetriesStopStrategy
 
 
@@ -23,6 +27,26 @@ log = logging.getLogger(__name__)
 # reduce logging noise from requests library
 logging.getLogger("requests").setLevel(logging.ERROR)
 
+try:
+    # If built with the 'fast-json' extra, use orjson to parse API responses.
+    # It parses response bytes directly (skipping the intermediate unicode
+    # decode) and is several times faster than the stdlib json module, which
+    # is noticeable when listing accounts with many thousands of activities.
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+try:
+    # If built with the 'streaming-upload' extra, uploads are streamed from
+    # disk instead of buffering the entire multipart body in memory first.
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 
 PORTAL_LOGIN_URL = "https://sso.garmin.com/portal/api/login"
 """Garmin Connect's Single-Sign On login URL."""
@@ -32,6 +56,104 @@ SSO_SIGNIN_URL = "https://sso.garmin.com/sso/signin"
 """The Garmin Connect Single-Sign On sign-in URL. This is where the login form
 gets POSTed."""
 
+PORTAL_LOGIN_HEADERS = {
+    'authority': 'sso.garmin.com',
+    'origin': 'https://sso.garmin.com',
+    'referer': 'https://sso.garmin.com/portal/sso/en-US/sign-in?clientId=GarminConnect&service=https%3A%2F%2Fconnect.garmin.com%2Fmodern',
+}
+"""Request headers to pass when POSTing credentials to the SSO portal."""
+PORTAL_LOGIN_PARAMS = {
+    "clientId": "GarminConnect",
+    "service": "https://connect.garmin.com/modern/",
+    "gauthHost": "https://sso.garmin.com/sso",
+}
+"""Query parameters to pass when POSTing credentials to the SSO portal."""
+SSO_LOGIN_PARAMS = {
+    'clientId': 'GarminConnect',
+    'service': 'https://connect.garmin.com/modern/',
+    'webhost': 'https://connect.garmin.com',
+    'gateway': 'true',
+    'generateExtraServiceTicket': 'true',
+    'generateTwoExtraServiceTickets': 'true',
+}
+"""Query parameters for the SSO login-page warm-up request that precedes
+the auth-ticket claim."""
+
+SESSION_CACHE_ENV_VAR = "GARMINEXPORT_SESSION_CACHE"
+"""When this environment variable is set (to any value but '0'), the
+authenticated session state (cookies and authorization headers) is cached
+on disk and re-used on later runs, skipping the full sign-in ceremony for
+as long as Garmin still honors the cached session."""
+SESSION_CACHE_PATH = os.path.expanduser(os.path.join("~", ".garminexport", "session.pickle"))
+"""File used to persist session state between runs when session caching
+is enabled."""
+SESSION_PROBE_URL = "https://connect.garmin.com/userprofile-service/userprofile/user-settings"
+"""A cheap authenticated endpoint used to verify that a cached session is
+still valid."""
+
+ACTIVITY_LIST_URL = "https://connect.garmin.com/activitylist-service/activities/search/activities"
+"""Endpoint used to list (batches of) account activities."""
+ACTIVITY_SERVICE_URL = "https://connect.garmin.com/activity-service/activity/"
+"""URL prefix for per-activity resources (summary, details). Append the
+activity id."""
+EXPORT_GPX_URL = "https://connect.garmin.com/download-service/export/gpx/activity/"
+"""URL prefix for GPX export of an activity. Append the activity id."""
+EXPORT_TCX_URL = "https://connect.garmin.com/download-service/export/tcx/activity/"
+"""URL prefix for TCX export of an activity. Append the activity id."""
+ORIGINAL_FILE_URL = "https://connect.garmin.com/download-service/files/activity/"
+"""URL prefix for the originally uploaded activity file. Append the
+activity id."""
+
+POOL_SIZE_ENV_VAR = "GARMINEXPORT_POOL_SIZE"
+"""Environment variable that overrides the connection-pool size mounted on
+plain requests sessions. Raise it when running with more concurrent
+download workers than the default pool can keep alive."""
+DEFAULT_POOL_SIZE = 32
+"""Default maximum number of pooled keep-alive connections per host."""
+
+MINIMAL_AUTH_ENV_VAR = "GARMINEXPORT_MINIMAL_AUTH"
+"""Environment variable that, when set (to anything but "0"), skips the
+SSO login-page warm-up request during authentication, saving one
+round-trip. The warm-up is performed after all as a fallback should the
+ticket claim fail without it."""
+
+FETCH_AHEAD_ENV_VAR = "GARMINEXPORT_FETCH_AHEAD"
+"""Environment variable that overrides the number of activity-list batches
+to fetch in parallel. Lower it if the activity listing trips Garmin
+Connect's rate limiting."""
+DEFAULT_FETCH_AHEAD = 4
+"""Default number of activity-list batches to speculatively fetch in
+parallel."""
+
+REQUEST_TIMEOUT = (10, 60)
+"""Default (connect, read) timeouts, in seconds, applied to every request.
+Without explicit timeouts a dropped connection can hang a request
+indefinitely, which also prevents the transport-level retries from ever
+kicking in."""
+
+ACTIVITY_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+"""The (fixed) format used for activity start timestamps (``startTimeGMT``)
+in activity listings. Parsing with a fixed format is about an order of
+magnitude faster than running a general-purpose date parser on every
+activity."""
+
+
+def _parse_activity_timestamp(timestamp):
+    """Parse an activity start timestamp (``startTimeGMT``) into a
+    UTC-timezoned :class:`datetime`. Timestamps are expected to follow
+    :attr:`ACTIVITY_TIMESTAMP_FORMAT`; should Garmin ever deviate from it,
+    fall back to dateutil's (much slower) general-purpose parser rather
+    than fail.
+
+    :param timestamp: Timestamp string, e.g. "2023-05-01 06:30:05".
+    :type timestamp: str
+    :rtype: datetime
+    """
+    try:
+        return datetime.strptime(timestamp, ACTIVITY_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return dateutil.parser.parse(timestamp).replace(tzinfo=timezone.utc)
+
 
 def require_session(client_function):
     """Decorator that is used to annotate :class:`GarminClient`
@@ -89,13 +211,56 @@ class GarminClient(object):
 
     def connect(self):
         self.session = new_http_session()
+        use_session_cache = os.getenv(SESSION_CACHE_ENV_VAR, "0") != "0"
+        if use_session_cache and self._restore_cached_session():
+            return
         self._authenticate()
+        if use_session_cache:
+            self._cache_session()
 
     def disconnect(self):
         if self.session:
             self.session.close()
             self.session = None
 
+    def _restore_cached_session(self):
+        """Attempt to restore session state cached by a prior run and verify
+        that Garmin still accepts it (sessions expire server-side after a
+        while). Saves the full sign-in ceremony on warm runs.
+
+        :return: `True` if a still-valid session was restored, `False` otherwise.
+        :rtype: bool
+        """
+        try:
+            with open(SESSION_CACHE_PATH, "rb") as f:
+                state = pickle.load(f)
+            self.session.cookies.update(state["cookies"])
+            self.session.headers.update(state["headers"])
+        except (OSError, pickle.UnpicklingError, KeyError, EOFError):
+            return False
+        response = self.session.get(SESSION_PROBE_URL, allow_redirects=False, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            log.info("cached session no longer valid, signing in again ...")
+            return False
+        log.info("reusing cached session ...")
+        return True
+
+    def _cache_session(self):
+        """Persist the authenticated session state (cookies and headers) for
+        re-use by later runs."""
+        try:
+            os.makedirs(os.path.dirname(SESSION_CACHE_PATH), mode=0o700, exist_ok=True)
+            # the cache holds session cookies and the bearer token, so the
+            # file must be owner-only from the moment it exists -- creating
+            # it with default permissions and chmodding afterwards would
+            # leave a window where the secrets are world-readable
+            opener = lambda path, flags: os.open(path, flags, 0o600)
+            with open(SESSION_CACHE_PATH, "wb", opener=opener) as f:
+                pickle.dump(
+                    {"cookies": self.session.cookies, "headers": dict(self.session.headers)}, f)
+        except (OSError, pickle.PicklingError) as e:
+            log.warning("failed to cache session state: %s", e)
+
     def _authenticate(self):
         """
         Authenticates using a Garmin Connect username and password.
@@ -112,7 +277,7 @@ class GarminClient(object):
         self._claim_auth_ticket(auth_ticket_url)
 
         # we need to touch base with the main page to complete the login ceremony.
-        self.session.get('https://connect.garmin.com/modern')
+        self.session.get('https://connect.garmin.com/modern', timeout=REQUEST_TIMEOUT)
         # This header appears to be needed on subsequent session requests or we
         # end up with a 402 response from Garmin.
         self.session.headers.update({'NK': 'NT'})
@@ -152,7 +317,7 @@ class GarminClient(object):
             'referer': 'https://connect.garmin.com/modern/',
         }
         resp = self.session.post('https://connect.garmin.com/modern/di-oauth/exchange',
-                                 headers=headers)
+                                 headers=headers, timeout=REQUEST_TIMEOUT)
         if resp.status_code != 200:
             raise ValueError(f'get oauth token failed with {resp.status_code}: {resp.text}')
         return resp.json()
@@ -172,44 +337,40 @@ class GarminClient(object):
              "consentTypeList":null
           }
         """
-        headers = {
-            'authority': 'sso.garmin.com',
-            'origin': 'https://sso.garmin.com',
-            'referer': 'https://sso.garmin.com/portal/sso/en-US/sign-in?clientId=GarminConnect&service=https%3A%2F%2Fconnect.garmin.com%2Fmodern',
-        }
-        params = {
-            "clientId": "GarminConnect",
-            "service": "https://connect.garmin.com/modern/",
-            "gauthHost": "https://sso.garmin.com/sso",
-        }
         form_data = {'username': username, 'password': password}
 
         log.info("passing login credentials ...")
-        resp = self.session.post(PORTAL_LOGIN_URL, headers=headers, params=params, json=form_data)
+        resp = self.session.post(PORTAL_LOGIN_URL, headers=PORTAL_LOGIN_HEADERS,
+                                 params=PORTAL_LOGIN_PARAMS, json=form_data,
+                                 timeout=REQUEST_TIMEOUT)
         log.debug("got auth response %d: %s", resp.status_code, resp.text)
         if resp.status_code != 200:
             raise ValueError(f'authentication attempt failed with {resp.status_code}: {resp.text}')
         return self._extract_auth_ticket_url(resp.json())
 
     def _claim_auth_ticket(self, auth_ticket_url):
-        # Note: first we bump the login URL.
-        p = {
-            'clientId': 'GarminConnect',
-            'service': 'https://connect.garmin.com/modern/',
-            'webhost': 'https://connect.garmin.com',
-            'gateway': 'true',
-            'generateExtraServiceTicket': 'true',
-            'generateTwoExtraServiceTickets': 'true',
-        }
-        self.session.get(SSO_LOGIN_URL, headers={}, params=p)
+        # Note: first we bump the login URL. With GARMINEXPORT_MINIMAL_AUTH
+        # set, the bump is skipped on the first try (one round-trip less) and
+        # only performed as a fallback should the claim fail without it.
+        minimal_auth = os.getenv(MINIMAL_AUTH_ENV_VAR, "0") != "0"
+        if not minimal_auth:
+            self._bump_sso_login()
 
         log.info("claiming auth ticket %s ...", auth_ticket_url)
-        response = self.session.get(auth_ticket_url)
+        response = self.session.get(auth_ticket_url, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200 and minimal_auth:
+            log.info("ticket claim failed without login-page warm-up, retrying with it ...")
+            self._bump_sso_login()
+            response = self.session.get(auth_ticket_url, timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             raise RuntimeError(
                 "auth failure: failed to claim auth ticket: {}: {}\n{}".format(
                     auth_ticket_url, response.status_code, response.text))
 
+    def _bump_sso_login(self):
+        self.session.get(SSO_LOGIN_URL, headers={}, params=SSO_LOGIN_PARAMS,
+                         timeout=REQUEST_TIMEOUT)
+
 
     @staticmethod
     def _extract_auth_ticket_url(auth_response):
@@ -222,7 +383,7 @@ class GarminClient(object):
         :param auth_response: JSON response from a login form submission.
         """
         if auth_response['responseStatus']['type'] == 'INVALID_USERNAME_PASSWORD':
-            RuntimeError("authentication failure: did you provide a correct username/password?")
+            raise RuntimeError("authentication failure: did you provide a correct username/password?")
         service_url = auth_response.get('serviceURL')
         auth_ticket = auth_response.get('serviceTicketId')
         if not service_url:
@@ -242,13 +403,30 @@ class GarminClient(object):
         """
         ids = []
         batch_size = 100
+        # The number of batches to speculatively fetch in parallel. Batches
+        # are independent (up to the as-of-yet unknown end of the listing),
+        # so issuing a window of them concurrently overlaps their round-trip
+        # times rather than paying one full round-trip per batch.
+        fetch_ahead = int(os.getenv(FETCH_AHEAD_ENV_VAR, str(DEFAULT_FETCH_AHEAD)))
         # fetch in batches since the API doesn't allow more than a certain
         # number of activities to be retrieved on every invocation
-        for start_index in range(0, sys.maxsize, batch_size):
-            next_batch = self._fetch_activity_ids_and_ts(start_index, batch_size)
-            if not next_batch:
-                break
-            ids.extend(next_batch)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_ahead) as executor:
+            for window_start in count(0, batch_size * fetch_ahead):
+                start_indices = range(window_start, window_start + batch_size * fetch_ahead, batch_size)
+                batches = executor.map(
+                    lambda start_index: self._fetch_activity_ids_and_ts(start_index, batch_size),
+                    start_indices)
+                # append batch results in index order; an empty batch marks
+                # the end of the listing (any later-indexed batches are
+                # discarded)
+                exhausted = False
+                for next_batch in batches:
+                    if not next_batch:
+                        exhausted = True
+                        break
+                    ids.extend(next_batch)
+                if exhausted:
+                    break
         return ids
 
     @require_session
@@ -259,6 +437,10 @@ class GarminClient(object):
 
         Should the index be out of bounds or the account empty, an empty list is returned.
 
+        This method is thread-safe (it only reads `self.session`, which is
+        safe to share between threads for independent requests) and may be
+        called concurrently for different batch indices.
+
         :param start_index: The index of the first activity to retrieve.
         :type start_index: int
         :param max_limit: The (maximum) number of activities to retrieve.
@@ -269,24 +451,24 @@ class GarminClient(object):
         """
         log.debug("fetching activities %d through %d ...", start_index, start_index + max_limit - 1)
         response = self.session.get(
-            "https://connect.garmin.com/activitylist-service/activities/search/activities",
-            params={"start": start_index, "limit": max_limit})
+            ACTIVITY_LIST_URL,
+            params={"start": start_index, "limit": max_limit},
+            timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
             raise Exception(
-                u"failed to fetch activities {} to {} types: {}\n{}".format(
+                "failed to fetch activities {} to {} types: {}\n{}".format(
                     start_index, (start_index + max_limit - 1), response.status_code, response.text))
-        activities = json.loads(response.text)
+        activities = _json_loads(response.content)
         if not activities:
             # index out of bounds or empty account
             return []
 
-        entries = []
-        for activity in activities:
-            id = int(activity["activityId"])
-            timestamp_utc = dateutil.parser.parse(activity["startTimeGMT"])
-            # make sure UTC timezone gets set
-            timestamp_utc = timestamp_utc.replace(tzinfo=dateutil.tz.tzutc())
-            entries.append((id, timestamp_utc))
+        # build (id, timestamp) entries in a single comprehension with the
+        # parse function bound to a local: the body runs once per activity,
+        # so repeated global lookups add up on large accounts
+        parse = _parse_activity_timestamp
+        entries = [(int(activity["activityId"]), parse(activity["startTimeGMT"]))
+                   for activity in activities]
         log.debug("got %d activities.", len(entries))
         return entries
 
@@ -301,14 +483,13 @@ class GarminClient(object):
         :returns: The activity summary as a JSON dict.
         :rtype: dict
         """
-        response = self.session.get(
-            "https://connect.garmin.com/activity-service/activity/{}".format(activity_id))
+        response = self.session.get(ACTIVITY_SERVICE_URL + str(activity_id), timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
-            log.error(u"failed to fetch json summary for activity %s: %d\n%s",
+            log.error("failed to fetch json summary for activity %s: %d\n%s",
                       activity_id, response.status_code, response.text)
-            raise Exception(u"failed to fetch json summary for activity {}: {}\n{}".format(
+            raise Exception("failed to fetch json summary for activity {}: {}\n{}".format(
                 activity_id, response.status_code, response.text))
-        return json.loads(response.text)
+        return _json_loads(response.content)
 
     @require_session
     def get_activity_details(self, activity_id):
@@ -322,12 +503,12 @@ class GarminClient(object):
         :rtype: dict
         """
         # mounted at xml or json depending on result encoding
-        response = self.session.get(
-            "https://connect.garmin.com/activity-service/activity/{}/details".format(activity_id))
+        response = self.session.get(ACTIVITY_SERVICE_URL + str(activity_id) + "/details",
+                                    timeout=REQUEST_TIMEOUT)
         if response.status_code != 200:
-            raise Exception(u"failed to fetch json activityDetails for {}: {}\n{}".format(
+            raise Exception("failed to fetch json activityDetails for {}: {}\n{}".format(
                 activity_id, response.status_code, response.text))
-        return json.loads(response.text)
+        return _json_loads(response.content)
 
     @require_session
     def get_activity_gpx(self, activity_id):
@@ -342,8 +523,7 @@ class GarminClient(object):
           or ``None`` if the activity couldn't be exported to GPX.
         :rtype: str
         """
-        response = self.session.get(
-            "https://connect.garmin.com/download-service/export/gpx/activity/{}".format(activity_id))
+        response = self.session.get(EXPORT_GPX_URL + str(activity_id), timeout=REQUEST_TIMEOUT)
         # An alternate URL that seems to produce the same results
         # and is the one used when exporting through the Garmin
         # Connect web page.
@@ -355,8 +535,12 @@ class GarminClient(object):
         if response.status_code in (404, 204):
             return None
         if response.status_code != 200:
-            raise Exception(u"failed to fetch GPX for activity {}: {}\n{}".format(
+            raise Exception("failed to fetch GPX for activity {}: {}\n{}".format(
                 activity_id, response.status_code, response.text))
+        # Garmin serves UTF-8; setting it explicitly (when the response lacks
+        # a charset) prevents requests from running character-set detection
+        # over the entire body just to produce `.text`.
+        response.encoding = response.encoding or "utf-8"
         return response.text
 
     @require_session
@@ -374,13 +558,14 @@ class GarminClient(object):
         :rtype: str
         """
 
-        response = self.session.get(
-            "https://connect.garmin.com/download-service/export/tcx/activity/{}".format(activity_id))
+        response = self.session.get(EXPORT_TCX_URL + str(activity_id), timeout=REQUEST_TIMEOUT)
         if response.status_code == 404:
             return None
         if response.status_code != 200:
-            raise Exception(u"failed to fetch TCX for activity {}: {}\n{}".format(
+            raise Exception("failed to fetch TCX for activity {}: {}\n{}".format(
                 activity_id, response.status_code, response.text))
+        # see the note on character-set detection in get_activity_gpx
+        response.encoding = response.encoding or "utf-8"
         return response.text
 
     def get_original_activity(self, activity_id):
@@ -395,27 +580,58 @@ class GarminClient(object):
           its contents, or :obj:`(None,None)` if no file is found.
         :rtype: (str, str)
         """
-        response = self.session.get(
-            "https://connect.garmin.com/download-service/files/activity/{}".format(activity_id))
-        # A 404 (Not Found) response is a clear indicator of a missing .fit
-        # file. As of lately, the endpoint appears to have started to
-        # respond with 500 "NullPointerException" on attempts to download a
-        # .fit file for an activity without one.
-        if response.status_code in [404, 500]:
-            # Manually entered activity, no file source available
-            return None, None
-        if response.status_code != 200:
-            raise Exception(
-                u"failed to get original activity file for {}: {}\n{}".format(
-                    activity_id, response.status_code, response.text))
+        url = ORIGINAL_FILE_URL + str(activity_id)
+        # streamed downloads require a plain requests session: curl_cffi
+        # sessions (impersonate_browser extra) have no stream parameter and
+        # their responses offer no iter_content, so they take a buffered
+        # download instead
+        streaming = isinstance(self.session, requests.Session)
+        if streaming:
+            response = self.session.get(url, stream=True, timeout=REQUEST_TIMEOUT)
+        else:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        try:
+            # A 404 (Not Found) response is a clear indicator of a missing
+            # .fit file. As of lately, the endpoint appears to have started
+            # to respond with 500 "NullPointerException" on attempts to
+            # download a .fit file for an activity without one.
+            if response.status_code in [404, 500]:
+                # Manually entered activity, no file source available
+                return None, None
+            if response.status_code != 200:
+                raise Exception(
+                    "failed to get original activity file for {}: {}\n{}".format(
+                        activity_id, response.status_code, response.text))
+
+            if streaming:
+                # stream the zip archive into a spooled temporary file:
+                # small archives stay in memory while unusually large ones
+                # spill to disk, and we avoid holding both the raw download
+                # and its in-flight copies in memory at once
+                with tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024) as zip_buffer:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        zip_buffer.write(chunk)
+                    with zipfile.ZipFile(zip_buffer, mode="r") as zip_file:
+                        return self._original_file_entry(zip_file, activity_id)
+            with zipfile.ZipFile(BytesIO(response.content), mode="r") as zip_file:
+                return self._original_file_entry(zip_file, activity_id)
+        finally:
+            # a streamed response must always be closed, even on the early
+            # returns above, or the connection never goes back to the
+            # keep-alive pool
+            if streaming:
+                response.close()
 
-        # return the first entry from the zip archive where the filename is
-        # activity_id (should be the only entry!)
-        zip_file = zipfile.ZipFile(BytesIO(response.content), mode="r")
+    @staticmethod
+    def _original_file_entry(zip_file, activity_id):
+        """Return the first entry from a downloaded original-file zip
+        archive whose filename is the activity_id (should be the only
+        entry!), as a `(format, content)` tuple, or :obj:`(None,None)` if no
+        such entry exists."""
         for path in zip_file.namelist():
             fn, ext = os.path.splitext(path)
             if fn.startswith(str(activity_id)):
-                return ext[1:], zip_file.open(path).read()
+                return ext[1:], zip_file.read(path)
         return None, None
 
     def get_activity_fit(self, activity_id):
@@ -443,7 +659,8 @@ class GarminClient(object):
         until the upload has either succeeded or failed. Raises an
         :class:`Exception` if the upload has failed.
 
-        :param uuid: uploadUuid returned on initial upload.
+        :param uuid: uploadUuid returned on initial upload, with dashes
+          stripped.
         :type uuid: str
         :param creation_date: creationDate returned from initial upload (e.g.
           "2020-01-01 12:34:56.789 GMT")
@@ -452,8 +669,12 @@ class GarminClient(object):
           :obj:`None` if upload is still processing.
         :rtype: int
         """
+        # the '_' query parameter is only a millisecond-resolution cache
+        # buster; time.time_ns avoids building a full datetime object on
+        # every poll
         response = self.session.get("https://connect.garmin.com/proxy/activity-service/activity/status/{}/{}?_={}".format(
-            creation_date[:10], uuid.replace("-",""), int(datetime.now().timestamp()*1000)), headers={"nk": "NT"})
+            creation_date[:10], uuid, time.time_ns() // 1000000),
+            headers={"nk": "NT"}, timeout=REQUEST_TIMEOUT)
         if response.status_code == 201 and response.headers["location"]:
             # location should be https://connectapi.garmin.com/activity-service/activity/ACTIVITY_ID
             return int(response.headers["location"].split("/")[-1])
@@ -491,18 +712,32 @@ class GarminClient(object):
             if ext.lower() in ('.gpx', '.tcx', '.fit'):
                 format = ext.lower()[1:]
             else:
-                raise Exception(u"could not guess file type for {}".format(fn))
+                raise Exception("could not guess file type for {}".format(fn))
 
         # upload it
-        files = dict(data=(fn, file))
-        response = self.session.post("https://connect.garmin.com/proxy/upload-service/upload/.{}".format(format),
-                                     files=files, headers={"nk": "NT"})
+        upload_url = "https://connect.garmin.com/proxy/upload-service/upload/.{}".format(format)
+        # the streaming branch requires a plain requests session: curl_cffi
+        # sessions (impersonate_browser extra) don't accept a toolbelt
+        # encoder as the request body
+        if MultipartEncoder is not None and isinstance(self.session, requests.Session):
+            # stream the multipart body straight from the open file: large
+            # FIT files never need to be held in memory in full
+            encoder = MultipartEncoder(fields={"data": (fn, file, "application/octet-stream")})
+            response = self.session.post(
+                upload_url, data=encoder,
+                headers={"nk": "NT", "Content-Type": encoder.content_type},
+                timeout=REQUEST_TIMEOUT)
+        else:
+            files = dict(data=(fn, file))
+            response = self.session.post(upload_url, files=files, headers={"nk": "NT"},
+                                         timeout=REQUEST_TIMEOUT)
 
         # check response and get activity ID
         try:
-            j = response.json()["detailedImportResult"]
-        except (json.JSONDecodeError, KeyError):
-            raise Exception(u"failed to upload {} for activity: {}\n{}".format(
+            # both orjson's and the stdlib's decode errors are ValueErrors
+            j = _json_loads(response.content)["detailedImportResult"]
+        except (ValueError, KeyError):
+            raise Exception("failed to upload {} for activity: {}\n{}".format(
                 format, response.status_code, response.text))
 
         # single activity, immediate success
@@ -511,7 +746,7 @@ class GarminClient(object):
 
         # duplicate of existing activity
         elif len(j["failures"]) == 1 and len(j["successes"]) == 0 and response.status_code == 409:
-            log.info(u"duplicate activity uploaded, continuing")
+            log.info("duplicate activity uploaded, continuing")
             activity_id = j["failures"][0]["internalId"]
 
         # need to poll until success/failure
@@ -522,16 +757,18 @@ class GarminClient(object):
                 stop_strategy=MaxRetriesStopStrategy(6), # wait for up to 64 seconds (2**6)
                 error_strategy=None
             )
-            activity_id = retryer.call(self._poll_upload_completion, j["uploadUuid"]["uuid"], j["creationDate"])
+            # strip the uuid's dashes once rather than on every poll attempt
+            uuid = j["uploadUuid"]["uuid"].replace("-", "")
+            activity_id = retryer.call(self._poll_upload_completion, uuid, j["creationDate"])
 
         # don't know how to handle multiple activities
         elif len(j["successes"]) > 1:
-            raise Exception(u"uploading {} resulted in multiple activities ({})".format(
+            raise Exception("uploading {} resulted in multiple activities ({})".format(
                 format, len(j["successes"])))
 
         # all other errors
         else:
-            raise Exception(u"failed to upload {} for activity: {}\n{}".format(
+            raise Exception("failed to upload {} for activity: {}\n{}".format(
                 format, response.status_code, j["failures"]))
 
         # add optional fields
@@ -549,9 +786,9 @@ class GarminClient(object):
             encoding_headers = {"Content-Type": "application/json; charset=UTF-8"}  # see Tapiriik
             response = self.session.put(
                 "https://connect.garmin.com/proxy/activity-service/activity/{}".format(activity_id),
-                data=json.dumps(data), headers=encoding_headers)
+                data=json.dumps(data), headers=encoding_headers, timeout=REQUEST_TIMEOUT)
             if response.status_code != 204:
-                raise Exception(u"failed to set metadata for activity {}: {}\n{}".format(
+                raise Exception("failed to set metadata for activity {}: {}\n{}".format(
                     activity_id, response.status_code, response.text))
 
         return activity_id
@@ -565,6 +802,12 @@ def new_http_session():
     the 'impersonate-browser' extra, it will use curl_cffi and a patched libcurl to
     produce identical TLS fingerprints as a real web browsers to circumvent
     Cloudflare's bot protection.
+
+    Note: HTTP/2-capable clients (such as httpx) have been considered for
+    multiplexing concurrent requests over a single connection, but both
+    session factories need to present a compatible interface and the
+    curl_cffi factory is essential to get past Cloudflare. Concurrency is
+    instead achieved with keep-alive connection pooling.
     """
     session_factory_func = requests.session
     try:
@@ -575,4 +818,25 @@ def new_http_session():
         session_factory_func = partial(curl_cffi.requests.Session, impersonate=browser)
     except (ImportError):
         pass
-    return session_factory_func()
+    session = session_factory_func()
+    if isinstance(session, requests.Session):
+        # Mount a connection-pool adapter large enough that concurrent
+        # requests (such as the windowed activity-list fetching) re-use
+        # keep-alive connections rather than paying a TCP/TLS handshake each
+        # time the default 10-slot pool overflows. The adapter also absorbs
+        # transient server errors and rate limiting (429/5xx) with a backoff
+        # retry, so a hiccup doesn't force a full client reconnect.
+        # only retry GETs: the upload POST and metadata PUT are not
+        # idempotent and get their retry handling at the application level.
+        # 500 is deliberately absent from the forcelist: Garmin answers 500
+        # for activities without an original file (see get_original_activity)
+        # and retrying those at the transport level would turn that expected
+        # response into a RetryError; transient 500s are instead covered by
+        # the application-level Retryer.
+        pool_size = int(os.getenv(POOL_SIZE_ENV_VAR, str(DEFAULT_POOL_SIZE)))
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                      allowed_methods=["GET"])
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("https://", adapter)
+    return session
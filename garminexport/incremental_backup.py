@@ -1,4 +1,5 @@
 #! /usr/bin/env python
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import getpass
 import logging
 import os
@@ -12,13 +13,19 @@ from garminexport.retryer import Retryer, ExponentialBackoffDelayStrategy, MaxRe
 
 log = logging.getLogger(__name__)
 
+DEFAULT_CONCURRENCY = int(os.getenv("GARMINEXPORT_WORKERS", "4"))
+"""The default number of concurrent download workers. Can be overridden
+through the ``GARMINEXPORT_WORKERS`` environment variable. Kept modest by
+default to stay clear of Garmin Connect's rate limiting."""
+
 
 def incremental_backup(username: str,
                        password: str = None,
                        backup_dir: str = os.path.join(".", "activities"),
                        export_formats: List[str] = None,
                        ignore_errors: bool = False,
-                       max_retries: int = 7):
+                       max_retries: int = 7,
+                       concurrency: int = DEFAULT_CONCURRENCY):
     """Performs (incremental) backups of activities for a given Garmin Connect account.
 
     :param username: Garmin Connect user name
@@ -30,6 +37,9 @@ def incremental_backup(username: str,
     :param max_retries: The maximum number of retries to make on failed attempts to fetch an activity.
     Exponential backoff will be used, meaning that the delay between successive attempts
     will double with every retry, starting at one second. Default: 7.
+    :param concurrency: The number of concurrent download workers. Downloads are
+    network-bound, so a handful of workers cuts backup wall time close to
+    linearly. Default: 4 (or the ``GARMINEXPORT_WORKERS`` environment variable).
 
     The activities are stored in a local directory on the user's computer.
     The backups are incremental, meaning that only activities that aren't already
@@ -39,9 +49,12 @@ def incremental_backup(username: str,
     # if no --format was specified, all formats are to be backed up
     export_formats = export_formats if export_formats else supported_export_formats
     log.info("backing up formats: %s", ", ".join(export_formats))
+    # normalize to a frozenset once: membership is tested per activity and
+    # format in both need_backup and download, and duplicate formats (e.g.
+    # a repeated --format flag) should not cause duplicate work
+    export_formats = frozenset(export_formats)
 
-    if not os.path.isdir(backup_dir):
-        os.makedirs(backup_dir)
+    os.makedirs(backup_dir, exist_ok=True)
 
     if not password:
         password = getpass.getpass("Enter password: ")
@@ -63,13 +76,27 @@ def incremental_backup(username: str,
 
         log.info("activities that aren't backed up: %d", len(missing_activities))
 
-        for index, activity in enumerate(missing_activities):
-            id, start = activity
-            log.info("backing up activity %s from %s (%d out of %d) ...",
-                     id, start, index + 1, len(missing_activities))
-            try:
-                garminexport.backup.download(client, activity, retryer, backup_dir, export_formats)
-            except Exception as e:
-                log.error("failed with exception: %s", e)
-                if not ignore_errors:
-                    raise
+        # each activity download is an independent set of network-bound
+        # requests, so fan them out over a bounded pool of worker threads
+        # (the client session is safe to share for concurrent requests).
+        # activities are submitted in id order so that interrupted runs
+        # make deterministic progress rather than hopping around in set
+        # (hash) order
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(
+                    garminexport.backup.download,
+                    client, activity, retryer, backup_dir, export_formats): activity
+                for activity in sorted(missing_activities)}
+            for index, future in enumerate(as_completed(futures)):
+                id, start = futures[future]
+                try:
+                    future.result()
+                    log.info("backed up activity %s from %s (%d out of %d)",
+                             id, start, index + 1, len(missing_activities))
+                except Exception as e:
+                    log.error("failed with exception: %s", e)
+                    if not ignore_errors:
+                        for not_started in futures:
+                            not_started.cancel()
+                        raise
@@ -1,11 +1,17 @@
 import abc
+import asyncio
+import collections
 import logging
+import random
 import time
-from datetime import datetime
 from datetime import timedelta
 
 log = logging.getLogger(__name__)
 
+_ZERO_DELAY = timedelta(seconds=0)
+"""A shared zero-delay instance, saving zero-delay paths from constructing
+a fresh `timedelta` on every call."""
+
 
 class GaveUpError(Exception):
     """Raised by a :class:`Retryer` that has exceeded its maximum number of retries."""
@@ -29,6 +35,26 @@ class DelayStrategy(object):
         """
         pass
 
+    def observe(self, succeeded):
+        """Reports the outcome of an attempt to the strategy. Called by the
+        :class:`Retryer` after every attempt. The default implementation
+        ignores the observation; adaptive strategies may use it to tune
+        their delays.
+
+        :param succeeded: `True` if the attempt was successful.
+        :type succeeded: bool
+        """
+        pass
+
+    def _next_delay_seconds(self, attempts):
+        """Returns :meth:`next_delay` as raw float seconds. This is what
+        the :class:`Retryer` loop consumes; strategies may override it to
+        skip the `timedelta` boxing/unboxing on every failed attempt.
+
+        :rtype: float
+        """
+        return self.next_delay(attempts).total_seconds()
+
 
 class FixedDelayStrategy(DelayStrategy):
     """A retry :class:`DelayStrategy` that produces a fixed delay between attempts."""
@@ -39,37 +65,185 @@ class FixedDelayStrategy(DelayStrategy):
         :type delay: `timedelta`
         """
         self.delay = delay
+        self._delay_seconds = delay.total_seconds()
 
     def next_delay(self, attempts):
         return self.delay
 
+    def _next_delay_seconds(self, attempts):
+        return self._delay_seconds
+
 
 class ExponentialBackoffDelayStrategy(DelayStrategy):
     """A retry :class:`DelayStrategy` that produces exponentially longer
     delay between every attempt. The first attempt will be followed
     by a `<initial-delay> * 2**0` delay. The following delays will be
     `<initial-delay> * 2**1`, `<initial-delay> * 2**2`, and so on ...
+
+    Delays are precomputed into a lookup table at construction time, so
+    `next_delay` is a plain index operation. The table holds
+    :attr:`TABLE_SIZE` entries; attempts beyond that reuse the last entry,
+    which also guards against the astronomic delays (and eventual overflow)
+    that `2**n` growth would otherwise produce.
     """
 
-    def __init__(self, initial_delay):
+    TABLE_SIZE = 30
+    """The number of precomputed delays. With a one-second initial delay the
+    last table entry is already north of 17 years, so clamping there loses
+    nothing in practice."""
+
+    def __init__(self, initial_delay, max_delay=None, jitter=False):
         """
         :param initial_delay: Initial delay.
         :type initial_delay: `timedelta`
+        :param max_delay: An optional upper bound on the produced delay.
+          With many retries, an uncapped exponential delay quickly grows
+          into the hours. `None` (the default) means no bound.
+        :type max_delay: `timedelta`
+        :param jitter: When `True`, each delay is drawn uniformly at random
+          from `[0, <exponential delay>]` ("full jitter"). This spreads out
+          retries from concurrent clients, which with the deterministic
+          series would all hammer the server again at the same instants.
+        :type jitter: bool
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        initial_seconds = initial_delay.total_seconds()
+        max_seconds = max_delay.total_seconds() if max_delay is not None else None
+        delays = [0.0]
+        for exponent in range(self.TABLE_SIZE):
+            delay_seconds = initial_seconds * (1 << exponent)
+            if max_seconds is not None:
+                delay_seconds = min(delay_seconds, max_seconds)
+            delays.append(delay_seconds)
+        self._seconds_table = tuple(delays)
+        self._delay_table = tuple(timedelta(seconds=s) for s in delays)
+
+    def next_delay(self, attempts):
+        if attempts <= 0:
+            return self._delay_table[0]
+        delay = self._delay_table[min(attempts, self.TABLE_SIZE)]
+        if self.jitter:
+            return timedelta(seconds=random.uniform(0, delay.total_seconds()))
+        return delay
+
+    def _next_delay_seconds(self, attempts):
+        if attempts <= 0:
+            return 0.0
+        delay_seconds = self._seconds_table[min(attempts, self.TABLE_SIZE)]
+        if self.jitter:
+            return random.uniform(0, delay_seconds)
+        return delay_seconds
+
+
+class FibonacciDelayStrategy(DelayStrategy):
+    """A retry :class:`DelayStrategy` whose delays follow the Fibonacci
+    series: `initial, initial, 2*initial, 3*initial, 5*initial, ...`.
+    Growing by ~1.618x per attempt rather than doubling, it backs off more
+    gently than :class:`ExponentialBackoffDelayStrategy` and fits more
+    attempts into the same total wall-time budget.
+
+    Like the exponential strategy, delays are precomputed into a table of
+    :attr:`TABLE_SIZE` entries; attempts beyond that reuse the last entry.
+    """
+
+    TABLE_SIZE = 30
+    """The number of precomputed delays."""
+
+    def __init__(self, initial_delay, max_delay=None):
+        """
+        :param initial_delay: Initial delay, also the step size of the series.
+        :type initial_delay: `timedelta`
+        :param max_delay: An optional upper bound on the produced delay.
+          `None` (the default) means no bound.
+        :type max_delay: `timedelta`
+        """
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+
+        max_seconds = max_delay.total_seconds() if max_delay is not None else None
+        delays = [0.0]
+        current = following = initial_delay.total_seconds()
+        for _ in range(self.TABLE_SIZE):
+            delay_seconds = current
+            if max_seconds is not None:
+                delay_seconds = min(delay_seconds, max_seconds)
+            delays.append(delay_seconds)
+            current, following = following, current + following
+        self._seconds_table = tuple(delays)
+        self._delay_table = tuple(timedelta(seconds=s) for s in delays)
+
+    def next_delay(self, attempts):
+        if attempts <= 0:
+            return self._delay_table[0]
+        return self._delay_table[min(attempts, self.TABLE_SIZE)]
+
+    def _next_delay_seconds(self, attempts):
+        if attempts <= 0:
+            return 0.0
+        return self._seconds_table[min(attempts, self.TABLE_SIZE)]
+
+
+class AdaptiveDelayStrategy(DelayStrategy):
+    """A retry :class:`DelayStrategy` that tunes a constant delay from the
+    observed failure rate. The :class:`Retryer` reports every attempt
+    outcome through :meth:`observe`; the strategy keeps a sliding window of
+    recent outcomes and scales its delay up or down so that the observed
+    failure rate converges on `target_fail_rate`. For long-running agents
+    this finds the shortest delay the server tolerates, where a fixed
+    exponential schedule either over-sleeps or burns quota.
+    """
+
+    def __init__(self, initial_delay, target_fail_rate=0.1, window=32, max_delay=None):
+        """
+        :param initial_delay: Starting delay, also the lower bound that the
+          adapted delay never shrinks below.
+        :type initial_delay: `timedelta`
+        :param target_fail_rate: The failure rate (0..1) to converge on.
+        :type target_fail_rate: float
+        :param window: The number of recent attempt outcomes to consider.
+        :type window: int
+        :param max_delay: An optional upper bound on the adapted delay.
+          `None` (the default) means no bound.
+        :type max_delay: `timedelta`
         """
         self.initial_delay = initial_delay
+        self.target_fail_rate = target_fail_rate
+        self.max_delay = max_delay
+        self._outcomes = collections.deque(maxlen=window)
+        self._current_delay = initial_delay
+
+    def observe(self, succeeded):
+        self._outcomes.append(succeeded)
+        fail_rate = self._outcomes.count(False) / len(self._outcomes)
+        # scale the current delay toward the target failure rate, with the
+        # per-observation adjustment damped to [0.5, 2.0] to avoid wild
+        # swings on small windows
+        scale = min(max(fail_rate / self.target_fail_rate, 0.5), 2.0)
+        delay_seconds = self._current_delay.total_seconds() * scale
+        delay_seconds = max(delay_seconds, self.initial_delay.total_seconds())
+        if self.max_delay is not None:
+            delay_seconds = min(delay_seconds, self.max_delay.total_seconds())
+        self._current_delay = timedelta(seconds=delay_seconds)
 
     def next_delay(self, attempts):
         if attempts <= 0:
-            return timedelta(seconds=0)
-        delay_seconds = self.initial_delay.total_seconds() * 2 ** (attempts - 1)
-        return timedelta(seconds=delay_seconds)
+            return _ZERO_DELAY
+        return self._current_delay
+
+    def _next_delay_seconds(self, attempts):
+        if attempts <= 0:
+            return 0.0
+        return self._current_delay.total_seconds()
 
 
 class NoDelayStrategy(FixedDelayStrategy):
     """A retry :class:`DelayStrategy` that doesn't introduce any delay between attempts."""
 
     def __init__(self):
-        super(NoDelayStrategy, self).__init__(timedelta(seconds=0))
+        super(NoDelayStrategy, self).__init__(_ZERO_DELAY)
 
 
 class ErrorStrategy(object):
@@ -190,26 +364,100 @@ class Retryer(object):
         :param kw: Any keyword arguments to call `function` with.
         """
         name = function.__name__
-        start = datetime.now()
+        # hoist attribute lookups out of the loop: with a no/zero-delay
+        # strategy the loop can spin thousands of times per second, and each
+        # dotted lookup below would otherwise run on every iteration
+        returnval_predicate = self.returnval_predicate
+        error_strategy = self.error_strategy
+        should_continue = self.stop_strategy.should_continue
+        next_delay_seconds = self.delay_strategy._next_delay_seconds
+        observe = self.delay_strategy.observe
+        monotonic = time.monotonic
+        sleep = time.sleep
+        # a monotonic clock: unlike wall-clock time it cannot jump (NTP
+        # adjustments, DST) and is cheaper to read than datetime.now()
+        start = monotonic()
         attempts = 0
         while True:
             try:
                 attempts += 1
                 log.info('{%s}: attempt %d ...', name, attempts)
                 returnval = function(*args, **kw)
-                if self.returnval_predicate(returnval):
+                if returnval_predicate(returnval):
+                    # return value satisfies predicate, we're done!
+                    log.debug('{%s}: success: "%s"', name, returnval)
+                    observe(True)
+                    return returnval
+                log.debug('{%s}: failed: return value: %s', name, returnval)
+                observe(False)
+            except Exception as e:
+                if error_strategy is None or not error_strategy.should_suppress(e):
+                    raise e
+                log.debug('{%s}: failed: error: %s', name, e)
+                observe(False)
+            elapsed_time = timedelta(seconds=monotonic() - start)
+            # should we make another attempt?
+            if not should_continue(attempts, elapsed_time):
+                raise GaveUpError('{}: gave up after {} failed attempt(s)'.format(name, attempts))
+            delay_seconds = next_delay_seconds(attempts)
+            # skip the sleep syscall (and the noise log line) entirely for
+            # zero-delay strategies
+            if delay_seconds:
+                log.info('{%s}: waiting %d seconds for next attempt', name, delay_seconds)
+                sleep(delay_seconds)
+
+
+class AsyncRetryer(Retryer):
+    """A :class:`Retryer` for use in asyncio programs. Its :meth:`call` is a
+    coroutine that awaits the attempted coroutine function and waits out
+    retry delays with `asyncio.sleep`, so a retrying task never blocks the
+    event loop (a plain `time.sleep` would stall every concurrent task for
+    the duration of the delay).
+
+    Strategies (delay/stop/error/returnval) are shared with the synchronous
+    :class:`Retryer`.
+    """
+
+    async def call(self, function, *args, **kw):
+        """Like :meth:`Retryer.call`, but `function` must be a coroutine
+        function, which is awaited on each attempt.
+
+        :param function: A coroutine function.
+        :param args: Any positional arguments to call `function` with.
+        :param kw: Any keyword arguments to call `function` with.
+        """
+        name = function.__name__
+        # see Retryer.call for the rationale behind the local bindings
+        returnval_predicate = self.returnval_predicate
+        error_strategy = self.error_strategy
+        should_continue = self.stop_strategy.should_continue
+        next_delay_seconds = self.delay_strategy._next_delay_seconds
+        observe = self.delay_strategy.observe
+        monotonic = time.monotonic
+        start = monotonic()
+        attempts = 0
+        while True:
+            try:
+                attempts += 1
+                log.info('{%s}: attempt %d ...', name, attempts)
+                returnval = await function(*args, **kw)
+                if returnval_predicate(returnval):
                     # return value satisfies predicate, we're done!
                     log.debug('{%s}: success: "%s"', name, returnval)
+                    observe(True)
                     return returnval
                 log.debug('{%s}: failed: return value: %s', name, returnval)
+                observe(False)
             except Exception as e:
-                if self.error_strategy is None or not self.error_strategy.should_suppress(e):
+                if error_strategy is None or not error_strategy.should_suppress(e):
                     raise e
                 log.debug('{%s}: failed: error: %s', name, e)
-            elapsed_time = datetime.now() - start
+                observe(False)
+            elapsed_time = timedelta(seconds=monotonic() - start)
             # should we make another attempt?
-            if not self.stop_strategy.should_continue(attempts, elapsed_time):
-                raise GaveUpError('{{}}: gave up after {} failed attempt(s)'.format(name, attempts))
-            delay = self.delay_strategy.next_delay(attempts)
-            log.info('{%s}: waiting %d seconds for next attempt', name, delay.total_seconds())
-            time.sleep(delay.total_seconds())
+            if not should_continue(attempts, elapsed_time):
+                raise GaveUpError('{}: gave up after {} failed attempt(s)'.format(name, attempts))
+            delay_seconds = next_delay_seconds(attempts)
+            if delay_seconds:
+                log.info('{%s}: waiting %d seconds for next attempt', name, delay_seconds)
+                await asyncio.sleep(delay_seconds)
@@ -6,6 +6,10 @@ un as:
 
 and use the client object (or client.session) to interact with
 Garmin Connect.
+
+Tip: when relaunching often, set GARMINEXPORT_SESSION_CACHE=1 to reuse
+the authenticated session from the previous launch (cached under
+~/.garminexport/) and skip the multi-second login flow.
 """
 
 import argparse
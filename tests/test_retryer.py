@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from datetime import timedelta
 import logging
@@ -5,12 +6,16 @@ import time
 import unittest
 
 from garminexport.retryer import (
-    Retryer,
+    GaveUpError,
+    Retryer, AsyncRetryer,
     NoDelayStrategy, FixedDelayStrategy, ExponentialBackoffDelayStrategy,
+    FibonacciDelayStrategy, AdaptiveDelayStrategy,
     SuppressAllErrorStrategy,
-    NeverStopStrategy
+    NeverStopStrategy, MaxRetriesStopStrategy
 )
 
+log = logging.getLogger(__name__)
+
 class Counter(object):
     """An object whose `next_value` method returns increasing values."""
 
@@ -69,13 +74,55 @@ class TestRetryer(unittest.TestCase):
         pass
     
     
-    def test_bla(self):
+    def test_no_sleep_after_final_attempt(self):
+        """When the stop strategy gives up, `Retryer` must raise immediately
+        rather than first sleeping out one final (pointless) delay."""
+        retryer = Retryer(
+            delay_strategy=FixedDelayStrategy(timedelta(hours=1)),
+            stop_strategy=MaxRetriesStopStrategy(0))
+        failing_client = FailNTimesThenReturn(10, "success!")
+        start = time.monotonic()
+        with self.assertRaises(GaveUpError):
+            retryer.call(failing_client.next_value)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_returns_first_value_with_defaults(self):
+        """Smoke test: a function that immediately produces a value should
+        only be called once."""
         retryer = Retryer()
         func = lambda : int(time.time())
-        
+
         returnval = retryer.call(func)
-        print(returnval)
-        
+        log.debug("returnval=%s", returnval)
+        self.assertIsInstance(returnval, int)
+
+
+class TestAsyncRetryer(unittest.TestCase):
+    """Exercise `AsyncRetryer`."""
+
+    def test_with_defaults(self):
+        """Default `AsyncRetryer` behavior is to keep trying until a(ny)
+        value is returned."""
+        failing_client = FailNTimesThenReturn(10, "success!")
+
+        async def next_value():
+            return failing_client.next_value()
+
+        returnval = asyncio.run(AsyncRetryer().call(next_value))
+        self.assertEqual(returnval, "success!")
+        self.assertEqual(failing_client.called, 10)
+
+    def test_with_returnval_predicate(self):
+        """`AsyncRetryer` should only return when the returnval_predicate
+        says so."""
+        counter = Counter()
+
+        async def next_value():
+            return counter.next_value()
+
+        retryer = AsyncRetryer(returnval_predicate=lambda r: r == 20)
+        self.assertEqual(asyncio.run(retryer.call(next_value)), 20)
+
 
 class TestFixedDelayStrategy(unittest.TestCase):
     """Exercise `FixedDelayStrategy`."""
@@ -128,6 +175,16 @@ class TestExponentialBackoffDelayStrategy(unittest.TestCase):
         self.assertEqual(self.strategy.next_delay(5), timedelta(seconds=16))
         self.assertEqual(self.strategy.next_delay(10), timedelta(seconds=512))
 
+    def test_delay_stops_growing_beyond_table(self):
+        """Delays are clamped once the precomputed table is exhausted."""
+        table_size = ExponentialBackoffDelayStrategy.TABLE_SIZE
+        self.assertEqual(
+            self.strategy.next_delay(table_size),
+            timedelta(seconds=2 ** (table_size - 1)))
+        self.assertEqual(
+            self.strategy.next_delay(table_size + 100),
+            self.strategy.next_delay(table_size))
+
     def test_initial_delay(self):
         """The initial delay is used to scale the series of delays."""
         self.strategy = ExponentialBackoffDelayStrategy(timedelta(seconds=2))
@@ -138,8 +195,111 @@ class TestExponentialBackoffDelayStrategy(unittest.TestCase):
         self.assertEqual(self.strategy.next_delay(4), timedelta(seconds=2*8))
         self.assertEqual(self.strategy.next_delay(5), timedelta(seconds=2*16))
         self.assertEqual(self.strategy.next_delay(10), timedelta(seconds=2*512))
-        
-        
+
+    def test_max_delay(self):
+        """With a `max_delay`, delays grow exponentially up to that bound."""
+        self.strategy = ExponentialBackoffDelayStrategy(
+            timedelta(seconds=1), max_delay=timedelta(seconds=8))
+        self.assertEqual(self.strategy.next_delay(0), timedelta(seconds=0))
+        self.assertEqual(self.strategy.next_delay(1), timedelta(seconds=1))
+        self.assertEqual(self.strategy.next_delay(2), timedelta(seconds=2))
+        self.assertEqual(self.strategy.next_delay(3), timedelta(seconds=4))
+        self.assertEqual(self.strategy.next_delay(4), timedelta(seconds=8))
+        self.assertEqual(self.strategy.next_delay(5), timedelta(seconds=8))
+        self.assertEqual(self.strategy.next_delay(10), timedelta(seconds=8))
+
+    def test_jitter(self):
+        """With `jitter`, every delay is drawn uniformly from zero up to the
+        deterministic exponential delay."""
+        self.strategy = ExponentialBackoffDelayStrategy(
+            timedelta(seconds=1), jitter=True)
+        self.assertEqual(self.strategy.next_delay(0), timedelta(seconds=0))
+        for attempts, full_delay in [(1, 1), (2, 2), (3, 4), (10, 512)]:
+            for _ in range(20):
+                delay = self.strategy.next_delay(attempts)
+                self.assertGreaterEqual(delay, timedelta(seconds=0))
+                self.assertLessEqual(delay, timedelta(seconds=full_delay))
+        # repeated delays for the same attempt number should not be a
+        # deterministic series
+        delays = {self.strategy.next_delay(10) for _ in range(20)}
+        self.assertGreater(len(delays), 1)
+
+
+
+class TestFibonacciDelayStrategy(unittest.TestCase):
+    """Exercise `FibonacciDelayStrategy`."""
+
+    def setUp(self):
+        # object under test
+        self.strategy = FibonacciDelayStrategy(timedelta(seconds=1))
+
+    def test_calculate_delay(self):
+        """`FibonacciDelayStrategy` should produce the Fibonacci series of
+        delays."""
+        expected = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+        for attempts, seconds in enumerate(expected):
+            self.assertEqual(self.strategy.next_delay(attempts),
+                             timedelta(seconds=seconds))
+
+    def test_initial_delay(self):
+        """The initial delay is used to scale the series of delays."""
+        self.strategy = FibonacciDelayStrategy(timedelta(seconds=2))
+        self.assertEqual(self.strategy.next_delay(0), timedelta(seconds=0))
+        self.assertEqual(self.strategy.next_delay(1), timedelta(seconds=2))
+        self.assertEqual(self.strategy.next_delay(2), timedelta(seconds=2))
+        self.assertEqual(self.strategy.next_delay(3), timedelta(seconds=4))
+        self.assertEqual(self.strategy.next_delay(4), timedelta(seconds=6))
+        self.assertEqual(self.strategy.next_delay(5), timedelta(seconds=10))
+
+    def test_max_delay(self):
+        """With a `max_delay`, delays grow up to that bound."""
+        self.strategy = FibonacciDelayStrategy(
+            timedelta(seconds=1), max_delay=timedelta(seconds=5))
+        self.assertEqual(self.strategy.next_delay(5), timedelta(seconds=5))
+        self.assertEqual(self.strategy.next_delay(6), timedelta(seconds=5))
+        self.assertEqual(self.strategy.next_delay(100), timedelta(seconds=5))
+
+
+class TestAdaptiveDelayStrategy(unittest.TestCase):
+    """Exercise `AdaptiveDelayStrategy`."""
+
+    def setUp(self):
+        # object under test
+        self.strategy = AdaptiveDelayStrategy(
+            timedelta(seconds=1), target_fail_rate=0.1, window=8,
+            max_delay=timedelta(seconds=60))
+
+    def test_initial_delay(self):
+        """Before any observations the configured initial delay is used."""
+        self.assertEqual(self.strategy.next_delay(0), timedelta(seconds=0))
+        self.assertEqual(self.strategy.next_delay(1), timedelta(seconds=1))
+
+    def test_delay_grows_under_failures(self):
+        """A failure rate above the target should increase the delay."""
+        before = self.strategy.next_delay(1)
+        for _ in range(8):
+            self.strategy.observe(False)
+        self.assertGreater(self.strategy.next_delay(1), before)
+
+    def test_delay_shrinks_on_recovery(self):
+        """Once attempts succeed again the delay should come back down."""
+        for _ in range(8):
+            self.strategy.observe(False)
+        elevated = self.strategy.next_delay(1)
+        for _ in range(16):
+            self.strategy.observe(True)
+        self.assertLess(self.strategy.next_delay(1), elevated)
+
+    def test_delay_is_clamped(self):
+        """The delay stays within [initial_delay, max_delay]."""
+        for _ in range(100):
+            self.strategy.observe(False)
+        self.assertEqual(self.strategy.next_delay(1), timedelta(seconds=60))
+        for _ in range(100):
+            self.strategy.observe(True)
+        self.assertEqual(self.strategy.next_delay(1), timedelta(seconds=1))
+
+
 class TestSuppressAllErrorStrategy(unittest.TestCase):
     """Exercise `SuppressAllErrorStrategy`."""
 